@@ -247,9 +247,14 @@ def plot(
     Generates a Matplotlib canvas that is rendered to an image and later transformed into a list of
     unicode characters.
     """
+    import os
     import warnings
 
+    # Map is drawn on an offscreen canvas, so matplotlib doesn't have to probe GUI backends
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
     from pixel_map.plotter import (
+        BASEMAP_CACHE_DIRECTORY,
         get_predefined_dark_style,
         get_predefined_light_style,
         plot_geo_data,
@@ -317,6 +322,7 @@ def plot(
             console_width=console_width,
             console_height=console_height,
             plotting_dpi=plotting_dpi,
+            basemap_cache_directory=BASEMAP_CACHE_DIRECTORY,
         )
 
 
@@ -0,0 +1,104 @@
+"""
+Numba kernels for generating terminal output.
+
+Importing this module requires Numba, so it's imported only when the kernels are used.
+"""
+
+from typing import Any
+
+import numpy as np
+from numba import njit, prange
+
+ANSI_RESET_BYTES = np.frombuffer(b"\x1b[0m", dtype=np.uint8)
+
+
+def _render_ansi_cells(characters: Any, colors: Any, color_codes: Any) -> Any:
+    height, width = characters.shape
+    colors_number = colors.shape[2]
+    # Upper bound for a single row: every cell with a full escape sequence
+    # (\x1b[ + 38;2;RRR;GGG;BBB per color + m) and a 4-byte character, plus reset and new line.
+    row_stride = width * (3 + 18 * colors_number + 4) + len(ANSI_RESET_BYTES) + 1
+    buffer = np.empty(height * row_stride, dtype=np.uint8)
+    row_lengths = np.zeros(height, dtype=np.int64)
+
+    for y in prange(height):
+        cursor = y * row_stride
+        for x in range(width):
+            color_changed = x == 0
+            if not color_changed:
+                current, previous = colors[y, x], colors[y, x - 1]
+                for color_idx in range(colors_number):
+                    for channel in range(3):
+                        if current[color_idx, channel] != previous[color_idx, channel]:
+                            color_changed = True
+
+            if color_changed and colors_number > 0:
+                buffer[cursor] = 27  # ESC
+                buffer[cursor + 1] = 91  # [
+                cursor += 2
+                for color_idx in range(colors_number):
+                    if color_idx > 0:
+                        buffer[cursor] = 59  # ;
+                        cursor += 1
+                    buffer[cursor] = color_codes[color_idx]
+                    buffer[cursor + 1] = 56  # 8
+                    buffer[cursor + 2] = 59  # ;
+                    buffer[cursor + 3] = 50  # 2
+                    cursor += 4
+                    for channel in range(3):
+                        value = colors[y, x, color_idx, channel]
+                        buffer[cursor] = 59  # ;
+                        cursor += 1
+                        if value >= 100:
+                            buffer[cursor] = 48 + value // 100
+                            cursor += 1
+                        if value >= 10:
+                            buffer[cursor] = 48 + (value // 10) % 10
+                            cursor += 1
+                        buffer[cursor] = 48 + value % 10
+                        cursor += 1
+                buffer[cursor] = 109  # m
+                cursor += 1
+
+            # UTF-8 encoding of the character code point
+            code_point = characters[y, x]
+            if code_point < 0x80:
+                buffer[cursor] = code_point
+                cursor += 1
+            elif code_point < 0x800:
+                buffer[cursor] = 0xC0 | (code_point >> 6)
+                buffer[cursor + 1] = 0x80 | (code_point & 0x3F)
+                cursor += 2
+            elif code_point < 0x10000:
+                buffer[cursor] = 0xE0 | (code_point >> 12)
+                buffer[cursor + 1] = 0x80 | ((code_point >> 6) & 0x3F)
+                buffer[cursor + 2] = 0x80 | (code_point & 0x3F)
+                cursor += 3
+            else:
+                buffer[cursor] = 0xF0 | (code_point >> 18)
+                buffer[cursor + 1] = 0x80 | ((code_point >> 12) & 0x3F)
+                buffer[cursor + 2] = 0x80 | ((code_point >> 6) & 0x3F)
+                buffer[cursor + 3] = 0x80 | (code_point & 0x3F)
+                cursor += 4
+
+        for reset_idx in range(len(ANSI_RESET_BYTES)):
+            buffer[cursor] = ANSI_RESET_BYTES[reset_idx]
+            cursor += 1
+        if y < height - 1:
+            buffer[cursor] = 10  # \n
+            cursor += 1
+
+        row_lengths[y] = cursor - y * row_stride
+
+    # Rows are written in parallel into fixed-size slots and compacted afterwards
+    total_length = 0
+    for y in range(height):
+        row_start = y * row_stride
+        for idx in range(row_lengths[y]):
+            buffer[total_length + idx] = buffer[row_start + idx]
+        total_length += row_lengths[y]
+
+    return buffer[:total_length]
+
+
+render_ansi_cells = njit(cache=True, parallel=True)(_render_ansi_cells)
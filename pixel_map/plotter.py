@@ -5,32 +5,62 @@ Generates a Matplotlib canvas that is rendered to an image and later transformed
 unicode characters.
 """
 
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Optional, Union
+from threading import Lock
+from typing import Any, Optional, Union, cast
 
 import contextily as cx
 import geopandas as gpd
 import numpy as np
-from matplotlib import pyplot as plt
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pyogrio
+import shapely
 from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from platformdirs import user_cache_dir
 from pyproj import Transformer
 from pyproj.enums import TransformDirection
 from rich import get_console
 from rich.box import HEAVY
-from rich.color import Color
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.style import Style
 from rich.text import Text
 
+from pixel_map import __app_name__
 from pixel_map.renderers import AVAILABLE_RENDERERS
 
+NUMBA_AVAILABLE = find_spec("numba") is not None
+
+# Importing and initializing Numba costs more than the NumPy path on smaller maps
+NUMBA_MIN_CELLS = 100_000
+
 TRANSFORMER = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
 
 EPSG_3857_BOUNDS = (-20037508.34, -20048966.1, 20037508.34, 20048966.1)
 
+# Bounds already matching the requested ratio are returned without projecting them back
+RATIO_TOLERANCE = 1e-9
+
+# Contextily removes its tiles cache on exit by default, so CLI keeps it in a user cache directory
+BASEMAP_CACHE_DIRECTORY = Path(user_cache_dir(__app_name__)) / "tiles"
+
+MAX_LOADING_WORKERS = 8
+
+FIGURE_LOCK = Lock()
+
+ANSI_RESET = "\x1b[0m"
+ANSI_FOREGROUND_CODE_BYTE = ord("3")
+ANSI_BACKGROUND_CODE_BYTE = ord("4")
+COLOR_VALUE_STRINGS = np.array([str(value) for value in range(256)])
+
 
 def plot_geo_data(
     files: list[str],
@@ -44,6 +74,7 @@ def plot_geo_data(
     console_width: Optional[int] = None,
     console_height: Optional[int] = None,
     plotting_dpi: int = 10,
+    basemap_cache_directory: Optional[Union[str, Path]] = None,
 ) -> None:
     """
     Plot the geo data into a terminal.
@@ -72,6 +103,9 @@ def plot_geo_data(
             Defaults to None.
         plotting_dpi (int, optional): Quality of matplotlib figure. It's used to multiply terminal
             size by some value to get better quality plot. Defaults to 10.
+        basemap_cache_directory (Union[str, Path], optional): Directory used by contextily to cache
+            downloaded basemap tiles. Tiles in this directory are never removed. If None, contextily
+            cache directory isn't changed. Defaults to None.
     """
     force_terminal = os.getenv("FORCE_TERMINAL_MODE", "false").lower() == "true"
     if force_terminal:
@@ -98,86 +132,101 @@ def plot_geo_data(
     map_ratio = map_width / map_height
 
     with _get_progress_object(console) as progress:
-        progress.add_task("Calculating bounding box", total=None)
+        task = progress.add_task("Calculating bounding box", total=None)
         bbox_axes_bounds = None
         if bbox:
             bbox, bbox_axes_bounds = _expand_bbox_to_match_ratio(bbox, ratio=map_ratio)
 
-    with _get_progress_object(console) as progress:
-        progress.add_task("Loading Geo data", total=None)
-        gdfs = _load_geo_data(files, bbox=bbox)
-        if bbox:
-            gdfs = [gdf.clip_by_rect(*bbox) for gdf in gdfs]
-
-    with _get_progress_object(console) as progress:
-        progress.add_task("Plotting geo data", total=None)
-        f, ax = plt.subplots(figsize=(map_width, map_height), dpi=plotting_dpi)
-
-        ax.set_axis_off()
-        ax.set_xticks([])
-        ax.set_yticks([])
-
-        f.patch.set_facecolor(background_color)
-        canvas = f.canvas
-        # gdf.to_crs(3857).plot(ax=ax, alpha=0.4)
-        if isinstance(color, str):
-            color = [color]
-        if isinstance(alpha, (int, float)):
-            alpha = [alpha]
-        for idx, gdf in enumerate(gdfs):
-            plot_color = color[idx % len(color)]
-            plot_alpha = alpha[idx % len(alpha)]
-            gdf.to_crs(3857).plot(ax=ax, color=plot_color, alpha=plot_alpha)
-
-        if bbox_axes_bounds:
-            left, bottom, right, top = bbox_axes_bounds
-            ax.set_xlim([left, right])
-            ax.set_ylim([bottom, top])
-
-        left, bottom, right, top = _expand_axes_limit_to_match_ratio(ax, ratio=map_ratio)
-
-        if basemap_provider:
-            try:
-                cx.add_basemap(
-                    ax,
-                    source=basemap_provider,
-                    crs=3857,
-                    attribution=False,
-                )
-            except ValueError:
-                cx.add_basemap(
-                    ax,
-                    source=basemap_provider,
-                    crs=3857,
-                    attribution=False,
-                    zoom=0,
-                )
-
-        ax.set_position((0, 0, 1, 1))
-        canvas.draw()
-
-        image_flat = np.frombuffer(canvas.tostring_rgb(), dtype="uint8")  # (H * W * 3,)
-        image = image_flat.reshape(*reversed(canvas.get_width_height()), 3)
-
-    with _get_progress_object(console) as progress:
-        progress.add_task("Rendering geo data", total=None)
-        renderer_object = AVAILABLE_RENDERERS[renderer](
-            terminal_width=terminal_width, terminal_height=terminal_height
-        )
-        characters, foreground_colors, background_colors = renderer_object.render_numpy(image)
-        full_rich_string = _construct_full_rich_string(
-            characters, foreground_colors, background_colors
+        progress.update(task, description="Loading Geo data")
+        # Figure doesn't depend on the data, so it's created while files are being loaded
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            figure_future = executor.submit(
+                _get_figure, width=map_width, height=map_height, dpi=plotting_dpi
+            )
+            gdfs = _load_geo_data(files, bbox=bbox)
+            if bbox:
+                gdfs = [gdf.clip_by_rect(*bbox) for gdf in gdfs]
+            f, canvas, ax = figure_future.result()
+
+        # Cached figure is shared between calls, so it can be used by only one thread at a time
+        with FIGURE_LOCK:
+            progress.update(task, description="Plotting geo data")
+            _clear_axes(ax)
+            f.patch.set_facecolor(background_color)
+            # gdf.to_crs(3857).plot(ax=ax, alpha=0.4)
+            if isinstance(color, str):
+                color = [color]
+            if isinstance(alpha, (int, float)):
+                alpha = [alpha]
+            for idx, gdf in enumerate(gdfs):
+                plot_color = color[idx % len(color)]
+                plot_alpha = alpha[idx % len(alpha)]
+                _to_web_mercator(gdf).plot(ax=ax, color=plot_color, alpha=plot_alpha)
+
+            if bbox_axes_bounds:
+                left, bottom, right, top = bbox_axes_bounds
+                ax.set_xlim([left, right])
+                ax.set_ylim([bottom, top])
+
+            left, bottom, right, top = _expand_axes_limit_to_match_ratio(ax, ratio=map_ratio)
+
+            if basemap_provider:
+                if basemap_cache_directory:
+                    cx.set_cache_dir(Path(basemap_cache_directory).as_posix())
+                try:
+                    cx.add_basemap(
+                        ax,
+                        source=basemap_provider,
+                        crs=3857,
+                        attribution=False,
+                        zoom="auto",
+                    )
+                except ValueError:
+                    cx.add_basemap(
+                        ax,
+                        source=basemap_provider,
+                        crs=3857,
+                        attribution=False,
+                        zoom=0,
+                    )
+
+            canvas.draw()
+
+            image = np.asarray(canvas.buffer_rgba())[..., :3]  # (H, W, 3) view without alpha
+
+            progress.update(task, description="Rendering geo data")
+            renderer_object = AVAILABLE_RENDERERS[renderer](
+                terminal_width=terminal_width, terminal_height=terminal_height
+            )
+            characters, foreground_colors, background_colors = renderer_object.render_numpy(image)
+
+        # Rich markup can be skipped only if the terminal accepts raw truecolor escape codes
+        # and the console doesn't have to convert the output (Jupyter or recording)
+        print_raw_ansi = (
+            no_border
+            and console.color_system == "truecolor"
+            and not console.no_color
+            and not console.is_jupyter
+            and not console.record
         )
+        if print_raw_ansi:
+            ansi_string = _construct_ansi_string(characters, foreground_colors, background_colors)
+        else:
+            full_rich_string = _construct_full_rich_string(
+                characters, foreground_colors, background_colors
+            )
 
-    if no_border:
+    if print_raw_ansi:
+        # Printed without wrapping and cropping, but still through the console output buffer
+        console.out(ansi_string, highlight=False)
+    elif no_border:
         console.print(full_rich_string)
     else:
         title = _generate_panel_title(files, terminal_width)
 
-        map_minx, map_miny = TRANSFORMER.transform(
-            left, bottom, direction=TransformDirection.INVERSE
+        (map_minx, map_maxx), (map_miny, map_maxy) = TRANSFORMER.transform(
+            (left, right), (bottom, top), direction=TransformDirection.INVERSE
         )
-        map_maxx, map_maxy = TRANSFORMER.transform(right, top, direction=TransformDirection.INVERSE)
         subtitle = _generate_panel_subtitle(
             map_minx, map_miny, map_maxx, map_maxy, terminal_width, terminal_height
         )
@@ -203,27 +252,105 @@ def get_predefined_light_style() -> tuple[str, str]:
     return "CartoDB.PositronNoLabels", "C0"
 
 
+@lru_cache(maxsize=4)
+def _get_figure(width: int, height: int, dpi: int) -> tuple[Figure, FigureCanvasAgg, Axes]:
+    # Figure is created without pyplot to avoid registering it in the global figure manager
+    f = Figure(figsize=(width, height), dpi=dpi)
+    canvas = FigureCanvasAgg(f)
+    # Axes fill the whole figure without any margins
+    ax = f.add_axes((0, 0, 1, 1))
+    return f, canvas, ax
+
+
+def _clear_axes(ax: Axes) -> None:
+    ax.clear()
+    ax.set_axis_off()
+    ax.set_xticks([])
+    ax.set_yticks([])
+
+
 def _load_geo_data(
     files: list[str], bbox: Optional[tuple[float, float, float, float]] = None
 ) -> list[gpd.GeoSeries]:
     paths = [Path(file_path) for file_path in files]
-    return [
-        (
-            _read_geoparquet_file(path, bbox=bbox).geometry
-            if path.suffix == ".parquet"
-            else gpd.read_file(path, bbox=bbox).geometry
-        )
-        for path in paths
-    ]
+    # Readers release the GIL during I/O, so multiple files can be loaded simultaneously
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_LOADING_WORKERS, len(paths)))) as executor:
+        return list(executor.map(partial(_read_geo_file, bbox=bbox), paths))
+
+
+def _read_geo_file(
+    path: Path, bbox: Optional[tuple[float, float, float, float]] = None
+) -> gpd.GeoSeries:
+    if path.suffix == ".parquet":
+        return _read_geoparquet_file(path, bbox=bbox)
+
+    return pyogrio.read_dataframe(path, bbox=bbox, columns=[]).geometry
 
 
 def _read_geoparquet_file(
     path: Path, bbox: Optional[tuple[float, float, float, float]] = None
-) -> gpd.GeoDataFrame:
+) -> gpd.GeoSeries:
+    # Only the geometry column is needed for plotting
+    columns = None
+    geo_metadata = _read_geoparquet_metadata(path)
+    if geo_metadata is not None:
+        geometry_column = geo_metadata["primary_column"]
+        columns = [geometry_column]
+        column_metadata = geo_metadata["columns"][geometry_column]
+        bbox_covering = column_metadata.get("covering", {}).get("bbox")
+        if (
+            bbox is not None
+            and bbox_covering is not None
+            and column_metadata.get("encoding") == "WKB"
+        ):
+            return _read_geoparquet_file_with_bbox_covering(
+                path,
+                bbox=bbox,
+                geometry_column=geometry_column,
+                bbox_covering=bbox_covering,
+                crs=column_metadata.get("crs", "OGC:CRS84"),
+            )
+
     try:
-        return gpd.read_parquet(path, bbox=bbox)
+        return gpd.read_parquet(path, bbox=bbox, columns=columns).geometry
     except Exception:
-        return gpd.read_parquet(path)
+        return gpd.read_parquet(path, columns=columns).geometry
+
+
+def _read_geoparquet_metadata(path: Path) -> Optional[dict[str, Any]]:
+    schema_metadata = pq.read_schema(path).metadata or {}
+    if b"geo" not in schema_metadata:
+        return None
+
+    return cast(dict[str, Any], json.loads(schema_metadata[b"geo"]))
+
+
+def _read_geoparquet_file_with_bbox_covering(
+    path: Path,
+    bbox: tuple[float, float, float, float],
+    geometry_column: str,
+    bbox_covering: dict[str, list[str]],
+    crs: Any,
+) -> gpd.GeoSeries:
+    # Filtering on the covering columns lets pyarrow skip row groups based on their statistics
+    minx, miny, maxx, maxy = bbox
+    bbox_filter = (
+        (pc.field(*bbox_covering["xmin"]) <= maxx)
+        & (pc.field(*bbox_covering["xmax"]) >= minx)
+        & (pc.field(*bbox_covering["ymin"]) <= maxy)
+        & (pc.field(*bbox_covering["ymax"]) >= miny)
+    )
+    table = pq.read_table(path, columns=[geometry_column], filters=bbox_filter)
+    geometries = shapely.from_wkb(table[geometry_column].to_numpy(), on_invalid="ignore")
+    return gpd.GeoSeries(geometries, crs=crs)
+
+
+def _to_web_mercator(geoseries: gpd.GeoSeries) -> gpd.GeoSeries:
+    # Reprojection transforms every vertex, so it's skipped if data is already in EPSG:3857
+    if geoseries.crs is not None and geoseries.crs.equals(3857):
+        return geoseries
+
+    return geoseries.to_crs(3857)
 
 
 def _expand_bbox_to_match_ratio(
@@ -231,12 +358,14 @@ def _expand_bbox_to_match_ratio(
 ) -> tuple[tuple[float, float, float, float], tuple[float, float, float, float]]:
     minx, miny, maxx, maxy = bbox
 
-    left, bottom = TRANSFORMER.transform(minx, miny)
-    right, top = TRANSFORMER.transform(maxx, maxy)
+    (left, right), (bottom, top) = TRANSFORMER.transform((minx, maxx), (miny, maxy))
 
     width = right - left
     height = top - bottom
     current_ratio = width / height
+    if _matches_ratio(current_ratio, ratio, left, bottom, right, top):
+        return bbox, (left, bottom, right, top)
+
     if current_ratio < ratio:
         new_width = (ratio / current_ratio) * width
         width_padding = (new_width - width) / 2
@@ -253,8 +382,9 @@ def _expand_bbox_to_match_ratio(
     right = min(right, EPSG_3857_BOUNDS[2])
     top = min(top, EPSG_3857_BOUNDS[3])
 
-    new_minx, new_miny = TRANSFORMER.transform(left, bottom, direction=TransformDirection.INVERSE)
-    new_maxx, new_maxy = TRANSFORMER.transform(right, top, direction=TransformDirection.INVERSE)
+    (new_minx, new_maxx), (new_miny, new_maxy) = TRANSFORMER.transform(
+        (left, right), (bottom, top), direction=TransformDirection.INVERSE
+    )
 
     return (new_minx, new_miny, new_maxx, new_maxy), (left, bottom, right, top)
 
@@ -265,6 +395,9 @@ def _expand_axes_limit_to_match_ratio(ax: Axes, ratio: float) -> tuple[float, fl
     width = right - left
     height = top - bottom
     current_ratio = width / height
+    if _matches_ratio(current_ratio, ratio, left, bottom, right, top):
+        return left, bottom, right, top
+
     if current_ratio < ratio:
         new_width = (ratio / current_ratio) * width
         width_padding = (new_width - width) / 2
@@ -287,25 +420,111 @@ def _expand_axes_limit_to_match_ratio(ax: Axes, ratio: float) -> tuple[float, fl
     return left, bottom, right, top
 
 
+def _matches_ratio(
+    current_ratio: float, ratio: float, left: float, bottom: float, right: float, top: float
+) -> bool:
+    return (
+        abs(current_ratio - ratio) < RATIO_TOLERANCE
+        and left >= EPSG_3857_BOUNDS[0]
+        and bottom >= EPSG_3857_BOUNDS[1]
+        and right <= EPSG_3857_BOUNDS[2]
+        and top <= EPSG_3857_BOUNDS[3]
+    )
+
+
 def _construct_full_rich_string(
     characters: Any, foreground_colors: Any, background_colors: Any
 ) -> Text:
-    has_fg_color = foreground_colors is not None
-    has_bg_color = background_colors is not None
-    result = Text()
-    for y in range(characters.shape[0]):
-        for x in range(characters.shape[1]):
-            idx = y, x
-            res = characters[idx]
-            result.append(
-                chr(res),
-                style=Style(
-                    color=(Color.from_rgb(*foreground_colors[idx]) if has_fg_color else None),
-                    bgcolor=(Color.from_rgb(*background_colors[idx]) if has_bg_color else None),
-                ),
+    # Decoding ANSI codes is faster than assembling the text with a style for every cell
+    return Text.from_ansi(
+        _construct_ansi_string(characters, foreground_colors, background_colors)
+    )
+
+
+def _construct_ansi_string(
+    characters: Any, foreground_colors: Any, background_colors: Any
+) -> str:
+    if NUMBA_AVAILABLE and characters.size >= NUMBA_MIN_CELLS:
+        try:
+            import pixel_map.numba_kernels  # noqa: F401
+        except ImportError:  # Installed Numba can still fail to import, e.g. with unsupported NumPy
+            pass
+        else:
+            return _construct_ansi_string_numba(characters, foreground_colors, background_colors)
+
+    return _construct_ansi_string_numpy(characters, foreground_colors, background_colors)
+
+
+def _construct_ansi_string_numpy(
+    characters: Any, foreground_colors: Any, background_colors: Any
+) -> str:
+    cells = np.ascontiguousarray(characters, dtype=np.uint32).view("U1").astype(object)
+    colors_with_codes = [
+        (code, colors)
+        for code, colors in (("38;2;", foreground_colors), ("48;2;", background_colors))
+        if colors is not None
+    ]
+
+    if colors_with_codes:
+        # Escape sequences are emitted only where the colors differ from the previous cell
+        packed_colors = np.zeros(characters.shape, dtype=np.uint64)
+        for _, colors in colors_with_codes:
+            rgb = colors.astype(np.uint64)
+            packed_colors = (
+                (packed_colors << np.uint64(24))
+                | (rgb[..., 0] << np.uint64(16))
+                | (rgb[..., 1] << np.uint64(8))
+                | rgb[..., 2]
             )
-        result.append("\n")
-    return result[:-1]
+        color_changed = np.ones(characters.shape, dtype=bool)
+        color_changed[:, 1:] = packed_colors[:, 1:] != packed_colors[:, :-1]
+
+        sequences = np.full(np.count_nonzero(color_changed), "\x1b[")
+        for idx, (code, colors) in enumerate(colors_with_codes):
+            if idx > 0:
+                sequences = np.char.add(sequences, ";")
+            sequences = np.char.add(
+                np.char.add(sequences, code),
+                _color_channel_strings(colors[color_changed], separator=";"),
+            )
+        sequences = np.char.add(sequences, "m")
+        cells[color_changed] = np.char.add(sequences, cells[color_changed].astype(str))
+
+    # Line endings are attached to the last cells so the output is joined in a single pass
+    cells[:, -1] += f"{ANSI_RESET}\n"
+    return "".join(cells.ravel().tolist())[:-1]
+
+
+def _construct_ansi_string_numba(
+    characters: Any, foreground_colors: Any, background_colors: Any
+) -> str:
+    from pixel_map.numba_kernels import render_ansi_cells
+
+    colors_with_codes = [
+        (code, colors)
+        for code, colors in (
+            (ANSI_FOREGROUND_CODE_BYTE, foreground_colors),
+            (ANSI_BACKGROUND_CODE_BYTE, background_colors),
+        )
+        if colors is not None
+    ]
+    stacked_colors = np.zeros((*characters.shape, len(colors_with_codes), 3), dtype=np.uint8)
+    for idx, (_, colors) in enumerate(colors_with_codes):
+        stacked_colors[..., idx, :] = colors
+    color_codes = np.array([code for code, _ in colors_with_codes], dtype=np.uint8)
+
+    ansi_bytes = render_ansi_cells(
+        np.ascontiguousarray(characters, dtype=np.uint32), stacked_colors, color_codes
+    )
+    return str(ansi_bytes.tobytes(), "utf-8")
+
+
+def _color_channel_strings(colors: Any, separator: str) -> Any:
+    channels = COLOR_VALUE_STRINGS[colors.astype(np.uint8)]
+    result = channels[..., 0]
+    for channel in (channels[..., 1], channels[..., 2]):
+        result = np.char.add(np.char.add(result, separator), channel)
+    return result
 
 
 def _generate_panel_title(files: list[str], terminal_width: int) -> str:
@@ -316,28 +535,33 @@ def _generate_panel_title(files: list[str], terminal_width: int) -> str:
     else:
         title = f"{len(file_paths)} files"
 
-    file_names_in_title = []
-    file_names_left = file_paths
-    while file_names_left:
-        current_file_name = file_names_left.pop(0)
-        file_names_in_title.append(current_file_name)
-        titles_joined = ", ".join(file_names_in_title)
-        titles_left = len(file_names_left)
-        if titles_left == 0:
-            new_title = titles_joined
-        elif titles_left == 1:
-            new_title = f"{titles_joined} + 1 other file"
-        else:
-            new_title = f"{titles_joined} + {titles_left} other files"
-
-        if len(new_title) > (terminal_width - 4):
+    max_title_length = terminal_width - 4
+    file_names_length = -2  # first file name isn't preceded by a separator
+    file_names_in_title = 0
+    for idx, file_name in enumerate(file_paths):
+        file_names_length += len(file_name) + 2
+        titles_left = len(file_paths) - idx - 1
+        if file_names_length + len(_other_files_suffix(titles_left)) > max_title_length:
             break
 
-        title = new_title
+        file_names_in_title = idx + 1
+
+    if file_names_in_title > 0:
+        titles_joined = ", ".join(file_paths[:file_names_in_title])
+        title = titles_joined + _other_files_suffix(len(file_paths) - file_names_in_title)
 
     return title
 
 
+def _other_files_suffix(titles_left: int) -> str:
+    if titles_left == 0:
+        return ""
+    elif titles_left == 1:
+        return " + 1 other file"
+
+    return f" + {titles_left} other files"
+
+
 def _generate_panel_subtitle(
     minx: float, miny: float, maxx: float, maxy: float, terminal_width: int, terminal_height: int
 ) -> str:
@@ -5,10 +5,49 @@ Look https://github.com/matrach/img2unicode/tree/master/examples for more inform
 about renderers.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from img2unicode import Renderer
+    from img2unicode import FastGenericDualOptimizer, Renderer
+
+
+class SolidCellsDualOptimizer:
+    """
+    Wrapper around img2unicode dual optimizer skipping the repeated glyph search for solid cells.
+
+    Cells filled with the same single color always get the same result, so the wrapped optimizer is
+    run only for one of them and its result is copied to the others.
+    """
+
+    def __init__(self, optimizer: "FastGenericDualOptimizer") -> None:
+        """Wrap the optimizer."""
+        self.optimizer = optimizer
+
+    def optimize_chunk(self, img: Any) -> tuple[Any, Any, Any]:
+        """Optimize characters and colors for an image divided into 16x8 cells."""
+        import numpy as np
+        from img2unicode.utils import cubify
+
+        pieces = cubify(img, (16, 8, 3))
+        pieces_pixels = pieces.reshape(len(pieces), -1, 3)
+        is_solid = (pieces_pixels == pieces_pixels[:, :1]).all(axis=(1, 2))
+
+        detailed_idx = np.flatnonzero(~is_solid)
+        solid_idx = np.flatnonzero(is_solid)
+        _, first_solid_idx, solid_color_idx = np.unique(
+            pieces_pixels[solid_idx, 0], axis=0, return_index=True, return_inverse=True
+        )
+
+        # Every piece points to its own optimized result or the one of the first solid piece
+        # with the same color
+        result_idx = np.empty(len(pieces), dtype=np.intp)
+        result_idx[detailed_idx] = np.arange(len(detailed_idx))
+        result_idx[solid_idx] = len(detailed_idx) + solid_color_idx.reshape(-1)
+
+        chars, fgs, bgs = self.optimizer.optimize_image(
+            pieces[np.concatenate((detailed_idx, solid_idx[first_solid_idx]))]
+        )
+        return chars[result_idx], fgs[result_idx], bgs[result_idx]
 
 
 def get_fast_block_renderer(terminal_width: int, terminal_height: int) -> "Renderer":
@@ -16,7 +55,7 @@ def get_fast_block_renderer(terminal_width: int, terminal_height: int) -> "Rende
     import img2unicode
 
     return img2unicode.Renderer(
-        img2unicode.FastGenericDualOptimizer("block"),
+        SolidCellsDualOptimizer(img2unicode.FastGenericDualOptimizer("block")),
         max_h=terminal_height,
         max_w=terminal_width,
         allow_upscale=True,
@@ -28,7 +67,7 @@ def get_fast_all_renderer(terminal_width: int, terminal_height: int) -> "Rendere
     import img2unicode
 
     return img2unicode.Renderer(
-        img2unicode.FastGenericDualOptimizer(),
+        SolidCellsDualOptimizer(img2unicode.FastGenericDualOptimizer()),
         max_h=terminal_height,
         max_w=terminal_width,
         allow_upscale=True,
@@ -40,7 +79,7 @@ def get_fast_ascii_renderer(terminal_width: int, terminal_height: int) -> "Rende
     import img2unicode
 
     return img2unicode.Renderer(
-        img2unicode.FastGenericDualOptimizer("ascii"),
+        SolidCellsDualOptimizer(img2unicode.FastGenericDualOptimizer("ascii")),
         max_h=terminal_height,
         max_w=terminal_width,
         allow_upscale=True,
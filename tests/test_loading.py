@@ -0,0 +1,35 @@
+"""Tests for loading geo data."""
+
+from pathlib import Path
+
+import geopandas as gpd
+
+from pixel_map.plotter import _load_geo_data
+
+EXAMPLE_FILE = (
+    Path(__file__).parent.parent / "pixel_map" / "example_files" / "monaco_buildings.parquet"
+)
+BBOX = (7.41855, 43.73259, 7.42227, 43.73528)
+
+
+def test_geoparquet_bbox_covering_filtering(tmp_path: Path) -> None:
+    """Test if bounding box is applied using GeoParquet covering columns."""
+    file_path = tmp_path / "monaco_buildings_covering.parquet"
+    gpd.read_parquet(EXAMPLE_FILE).to_parquet(
+        file_path, write_covering_bbox=True, row_group_size=100
+    )
+
+    (loaded_geometries,) = _load_geo_data([file_path.as_posix()], bbox=BBOX)
+    expected_geometries = gpd.read_parquet(file_path, bbox=BBOX).geometry
+
+    assert loaded_geometries.crs == expected_geometries.crs
+    assert loaded_geometries.reset_index(drop=True).geom_equals(
+        expected_geometries.reset_index(drop=True)
+    ).all()
+
+
+def test_geoparquet_without_bbox_covering() -> None:
+    """Test if GeoParquet file without covering columns is fully loaded."""
+    (loaded_geometries,) = _load_geo_data([EXAMPLE_FILE.as_posix()], bbox=BBOX)
+
+    assert len(loaded_geometries) == len(gpd.read_parquet(EXAMPLE_FILE))
@@ -0,0 +1,30 @@
+"""Tests for generating the map panel title."""
+
+from parametrization import Parametrization as P
+
+from pixel_map.plotter import _generate_panel_title
+
+
+@P.parameters("files", "terminal_width", "expected_title")  # type: ignore
+@P.case("Single file", ["data/a.parquet"], 80, "a.parquet")  # type: ignore
+@P.case("Single file too long", ["data/a.parquet"], 10, "1 file")  # type: ignore
+@P.case("Multiple files", ["a.parquet", "b.gpkg"], 80, "a.parquet, b.gpkg")  # type: ignore
+@P.case("Multiple files too long", ["a.parquet", "b.gpkg"], 10, "2 files")  # type: ignore
+@P.case(
+    "One file left", ["a.parquet", "long_file_name.gpkg"], 30, "a.parquet + 1 other file"
+)  # type: ignore
+@P.case(
+    "Multiple files left",
+    ["a.parquet", "b.gpkg", "c.geojson"],
+    31,
+    "a.parquet + 2 other files",
+)  # type: ignore
+@P.case(
+    "Stops at first file not fitting",
+    ["a.parquet", "long_file_name.parquet", "c.gpkg"],
+    40,
+    "a.parquet + 2 other files",
+)  # type: ignore
+def test_panel_title(files: list[str], terminal_width: int, expected_title: str) -> None:
+    """Test if panel title fits the terminal width."""
+    assert _generate_panel_title(files, terminal_width) == expected_title
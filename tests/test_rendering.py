@@ -0,0 +1,190 @@
+"""Tests for rendering characters and colors into terminal output."""
+
+import sys
+from io import StringIO
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pytest
+from parametrization import Parametrization as P
+from rich.console import Console
+from rich.text import Text
+
+from pixel_map import plotter
+from pixel_map.plotter import (
+    NUMBA_AVAILABLE,
+    _construct_ansi_string_numba,
+    _construct_ansi_string_numpy,
+    _construct_full_rich_string,
+)
+from pixel_map.renderers import SolidCellsDualOptimizer
+
+HEIGHT, WIDTH = 12, 40
+EXAMPLE_FILE = (
+    Path(__file__).parent.parent / "pixel_map" / "example_files" / "monaco_buildings.parquet"
+)
+
+Cell = tuple[str, Optional[tuple[int, ...]], Optional[tuple[int, ...]]]
+
+
+def _random_render_result() -> tuple[Any, Any, Any]:
+    rng = np.random.default_rng(42)
+    characters = rng.choice([ord(" "), ord("["), 0x2580, 0x2588, 0x2805], size=(HEIGHT, WIDTH))
+    palette = np.array([[0, 0, 0], [255, 128, 7], [10, 20, 30]], dtype=np.uint8)
+    foreground_colors = palette[rng.integers(0, 3, size=(HEIGHT, WIDTH))]
+    background_colors = palette[rng.integers(0, 2, size=(HEIGHT, WIDTH))]
+    return characters, foreground_colors, background_colors
+
+
+def _rendered_cells(text: Text) -> list[Cell]:
+    console = Console(color_system="truecolor", force_terminal=True, width=WIDTH)
+    cells: list[Cell] = []
+    for segment in console.render(text):
+        style = segment.style
+        foreground = tuple(style.color.triplet) if style and style.color else None
+        background = tuple(style.bgcolor.triplet) if style and style.bgcolor else None
+        cells.extend(
+            (character, foreground, background) for character in segment.text if character != "\n"
+        )
+    return cells
+
+
+def _expected_cells(
+    characters: Any, foreground_colors: Any, background_colors: Any
+) -> list[Cell]:
+    def _color(colors: Any, y: int, x: int) -> Optional[tuple[int, ...]]:
+        return tuple(int(value) for value in colors[y, x]) if colors is not None else None
+
+    return [
+        (
+            chr(characters[y, x]),
+            _color(foreground_colors, y, x),
+            _color(background_colors, y, x),
+        )
+        for y in range(HEIGHT)
+        for x in range(WIDTH)
+    ]
+
+
+@P.parameters("use_foreground", "use_background")  # type: ignore
+@P.case("Both colors", True, True)  # type: ignore
+@P.case("Only foreground", True, False)  # type: ignore
+@P.case("Only background", False, True)  # type: ignore
+@P.case("No colors", False, False)  # type: ignore
+def test_rich_text_renders_cells(use_foreground: bool, use_background: bool) -> None:
+    """Test if rich text output renders every cell with its character and colors."""
+    characters, foreground_colors, background_colors = _random_render_result()
+    foreground_colors = foreground_colors if use_foreground else None
+    background_colors = background_colors if use_background else None
+
+    rich_text = _construct_full_rich_string(characters, foreground_colors, background_colors)
+
+    assert _rendered_cells(rich_text) == _expected_cells(
+        characters, foreground_colors, background_colors
+    )
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="Numba is not installed")  # type: ignore
+@P.parameters("use_foreground", "use_background")  # type: ignore
+@P.case("Both colors", True, True)  # type: ignore
+@P.case("Only foreground", True, False)  # type: ignore
+@P.case("Only background", False, True)  # type: ignore
+@P.case("No colors", False, False)  # type: ignore
+def test_numba_ansi_string_matches_numpy(use_foreground: bool, use_background: bool) -> None:
+    """Test if Numba ANSI output is the same as the NumPy ANSI output."""
+    characters, foreground_colors, background_colors = _random_render_result()
+    foreground_colors = foreground_colors if use_foreground else None
+    background_colors = background_colors if use_background else None
+
+    assert _construct_ansi_string_numba(
+        characters, foreground_colors, background_colors
+    ) == _construct_ansi_string_numpy(characters, foreground_colors, background_colors)
+
+
+def test_ansi_string_falls_back_to_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if ANSI output is generated with NumPy when Numba kernels can't be imported."""
+    characters, foreground_colors, background_colors = _random_render_result()
+    monkeypatch.setattr(plotter, "NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(plotter, "NUMBA_MIN_CELLS", 0)
+    # Module set to None in sys.modules raises ImportError on import
+    monkeypatch.setitem(sys.modules, "pixel_map.numba_kernels", None)
+
+    assert plotter._construct_ansi_string(
+        characters, foreground_colors, background_colors
+    ) == _construct_ansi_string_numpy(characters, foreground_colors, background_colors)
+
+
+@P.parameters("charmask")  # type: ignore
+@P.case("Block", "block")  # type: ignore
+@P.case("All", None)  # type: ignore
+@P.case("Ascii", "ascii")  # type: ignore
+def test_solid_cells_optimizer_matches_wrapped_optimizer(charmask: Optional[str]) -> None:
+    """Test if skipping solid cells doesn't change the optimization result."""
+    import img2unicode
+
+    rng = np.random.default_rng(42)
+    image = np.zeros((HEIGHT * 16, WIDTH * 8, 3), dtype=np.float32)
+    image[:, : WIDTH * 4] = (0.2, 0.4, 0.6)
+    image[: HEIGHT * 8, WIDTH * 2 : WIDTH * 6] = rng.random((HEIGHT * 8, WIDTH * 4, 3))
+
+    optimizer = img2unicode.FastGenericDualOptimizer(charmask)
+    expected_chars, expected_fgs, expected_bgs = optimizer.optimize_chunk(image)
+    chars, fgs, bgs = SolidCellsDualOptimizer(optimizer).optimize_chunk(image)
+
+    np.testing.assert_array_equal(chars, expected_chars)
+    np.testing.assert_array_equal(fgs, expected_fgs)
+    np.testing.assert_array_equal(bgs, expected_bgs)
+
+
+def _plot_fullscreen(console: Console, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("FORCE_TERMINAL_MODE", raising=False)
+    monkeypatch.setattr(plotter, "get_console", lambda: console)
+    plotter.plot_geo_data(
+        [EXAMPLE_FILE.as_posix()],
+        renderer="block",
+        background_color="black",
+        no_border=True,
+        console_width=WIDTH,
+        console_height=HEIGHT + 1,
+    )
+
+
+def test_fullscreen_map_printed_as_raw_ansi(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if fullscreen map is written as raw ANSI codes to a truecolor terminal."""
+    output = StringIO()
+    console = Console(file=output, color_system="truecolor", force_terminal=True)
+
+    _plot_fullscreen(console, monkeypatch)
+
+    # Map is printed after the progress bar clears its line
+    map_lines = output.getvalue().rsplit("\x1b[2K", 1)[-1].split("\n")[:-1]
+    assert len(map_lines) == HEIGHT
+    assert all(line.startswith("\x1b[38;2;") for line in map_lines)
+    assert all(line.endswith("\x1b[0m") for line in map_lines)
+    assert all(len(Text.from_ansi(line)) == WIDTH for line in map_lines)
+
+
+def test_fullscreen_map_printed_with_rich_when_recording(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if fullscreen map is printed with rich when the console records the output."""
+    console = Console(file=StringIO(), color_system="truecolor", force_terminal=True, record=True)
+
+    _plot_fullscreen(console, monkeypatch)
+
+    # Raw ANSI output wouldn't be recorded by the console
+    map_lines = console.export_text().split("\n")[-HEIGHT - 1 : -1]
+    assert all(len(line) == WIDTH for line in map_lines)
+
+
+def test_fullscreen_map_printed_inside_console_capture(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if fullscreen map printed as raw ANSI codes is captured by the console."""
+    output = StringIO()
+    console = Console(file=output, color_system="truecolor", force_terminal=True)
+
+    with console.capture() as capture:
+        _plot_fullscreen(console, monkeypatch)
+
+    map_lines = capture.get().rsplit("\x1b[2K", 1)[-1].split("\n")[:-1]
+    assert len(map_lines) == HEIGHT
+    assert all(len(Text.from_ansi(line)) == WIDTH for line in map_lines)
+    assert "\x1b[38;2;" not in output.getvalue()